@@ -0,0 +1,136 @@
+"""
+Semantic Kernel wiring for the Northwind AI agent
+"""
+
+import functools
+import hashlib
+import os
+
+import diskcache
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+# Semantic Kernel imports
+import semantic_kernel as sk
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
+from semantic_kernel.core_plugins.text_plugin import TextPlugin
+from semantic_kernel.core_plugins.math_plugin import MathPlugin
+from semantic_kernel.functions.kernel_arguments import KernelArguments
+
+from config import get_config
+from db import NorthwindDatabase
+from plugins import AnalyticsPlugin, DatabasePlugin
+from plugins.sqlite_plugin import LARGE_RESULT_ROWS, SQLitePlugin
+
+@functools.lru_cache(maxsize=1)
+def _get_cache() -> diskcache.Cache:
+    """Open the on-disk cache of model responses on first use"""
+    return diskcache.Cache(get_config().llm_cache_path)
+
+# Main AI Agent Class
+class NorthwindAIAgent:
+    def __init__(self, openai_api_key: str, db_path: str = "northwind.db", allow_writes: bool = False):
+        self.kernel = sk.Kernel()
+        self.model_id = "gpt-4"
+        self.db_path = db_path
+        
+        # Add OpenAI chat completion service on a pooled HTTP/2 client so
+        # connections are reused across queries
+        self.http_client = DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+        self.kernel.add_service(OpenAIChatCompletion(
+            ai_model_id=self.model_id,
+            api_key=openai_api_key,
+            service_id="chat-gpt",
+            async_client=AsyncOpenAI(api_key=openai_api_key, http_client=self.http_client)
+        ))
+        
+        # Import plugins
+        self.kernel.add_plugin(DatabasePlugin(db_path, allow_writes), plugin_name="database")
+        self.kernel.add_plugin(AnalyticsPlugin(db_path), plugin_name="analytics")
+        self.kernel.add_plugin(TextPlugin(), plugin_name="text")
+        self.kernel.add_plugin(MathPlugin(), plugin_name="math")
+        
+        # Initialize database
+        self.db = NorthwindDatabase(db_path)
+        
+        # Define main agent prompt
+        self.agent_prompt = """
+        You are an AI agent specializing in analyzing the Northwind database.
+        
+        The database contains 11 tables:
+        1. Categories - Product categories
+        2. Suppliers - Supplier information  
+        3. Products - Product catalog
+        4. Customers - Customer information
+        5. Employees - Employee records
+        6. Shippers - Shipping companies
+        7. Orders - Order records
+        8. OrderDetails - Order line items
+        9. Region - Geographic regions
+        10. Territories - Sales territories
+        11. EmployeeTerritories - Employee territory assignments
+        
+        Available functions:
+        - database.execute_query: Execute SQL queries
+        - database.get_table_schema: Get table structure
+        - database.list_tables: List all tables
+        - analytics.analyze_sales_by_category: Analyze sales by category
+        - analytics.get_top_products: Get top performing products
+        
+        User Query: {{$query}}
+        
+        Analyze the query and provide a comprehensive answer using the available functions.
+        If you need to write SQL queries, make sure they are compatible with SQLite syntax.
+        """ + f"""Query results with more than {LARGE_RESULT_ROWS} rows come back as an object with a "columns"
+        list of names and a "data" list of row arrays in that column order.
+        """
+    
+    async def aclose(self):
+        """Close the pooled HTTP client used for model calls"""
+        await self.http_client.aclose()
+    
+    async def process_query(self, user_query: str) -> str:
+        """Process user query and return AI agent response"""
+        try:
+            # Identical questions against the same model, prompt and database
+            # state reuse the stored answer until it expires
+            generation = SQLitePlugin.write_generation(self.db_path)
+            key_source = "|".join((
+                self.model_id,
+                os.path.abspath(self.db_path),
+                str(generation),
+                self.agent_prompt,
+                user_query
+            ))
+            key = hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+            cache = _get_cache()
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            
+            # Create kernel arguments
+            arguments = KernelArguments(query=user_query)
+            
+            # Execute the agent prompt
+            response = await self.kernel.invoke_prompt(
+                function_name="agent_response",
+                plugin_name="main",
+                prompt=self.agent_prompt,
+                arguments=arguments
+            )
+            
+            result = str(response)
+            
+            # Don't store cancelled calls (None) or answers that wrote to the
+            # database, since replaying those would skip the write
+            if response is not None and SQLitePlugin.write_generation(self.db_path) == generation:
+                try:
+                    cache.set(key, result, expire=get_config().llm_cache_ttl)
+                except Exception:
+                    pass  # the answer is still good even if it could not be cached
+            return result
+        except Exception as e:
+            return f"Error processing query: {str(e)}"
@@ -1,21 +1,51 @@
 ﻿import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from dataclasses import dataclass
 
-load_dotenv()
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
-    database_path: str = os.getenv("DATABASE_PATH", "northwind.db")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
-    model_name: str = os.getenv("MODEL_NAME", "gpt-4")
-    max_tokens: int = int(os.getenv("MAX_TOKENS", "2000"))
-    temperature: float = float(os.getenv("TEMPERATURE", "0.7"))
+    openai_api_key: str = ""
+    database_path: str = "northwind.db"
+    log_level: str = "INFO"
+    model_name: str = "gpt-4"
+    max_tokens: int = 2000
+    temperature: float = 0.7
+    llm_cache_path: str = ".llm_cache"
+    llm_cache_ttl: int = 86400
 
     def validate(self) -> bool:
         if not self.openai_api_key:
             raise ValueError("OPENAI_API_KEY is required")
         return True
 
-config = Config()
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting, falling back to the default if it is malformed"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting, falling back to the default if it is malformed"""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Build the Config from the environment, loading .env on first use"""
+    if not os.environ.get("_DOTENV_LOADED"):
+        load_dotenv()
+        os.environ["_DOTENV_LOADED"] = "1"
+    return Config(
+        openai_api_key=os.environ.get("OPENAI_API_KEY", ""),
+        database_path=os.environ.get("DATABASE_PATH", "northwind.db"),
+        log_level=os.environ.get("LOG_LEVEL", "INFO"),
+        model_name=os.environ.get("MODEL_NAME", "gpt-4"),
+        max_tokens=_env_int("MAX_TOKENS", 2000),
+        temperature=_env_float("TEMPERATURE", 0.7),
+        llm_cache_path=os.environ.get("LLM_CACHE_PATH", ".llm_cache"),
+        llm_cache_ttl=_env_int("LLM_CACHE_TTL", 86400),
+    )
@@ -0,0 +1,253 @@
+"""
+Northwind database schema and sample data bootstrap
+"""
+
+import sqlite3
+
+# Sample rows for every table, loaded in this order
+SAMPLE_DATA = {
+    # Categories
+    'Categories': [
+        (1, 'Beverages', 'Soft drinks, coffees, teas, beers, and ales'),
+        (2, 'Condiments', 'Sweet and savory sauces, relishes, spreads, and seasonings'),
+        (3, 'Dairy Products', 'Cheeses'),
+        (4, 'Grains/Cereals', 'Breads, crackers, pasta, and cereal'),
+        (5, 'Seafood', 'Seaweed and fish')
+    ],
+    # Suppliers
+    'Suppliers': [
+        (1, 'Exotic Liquids', 'Charlotte Cooper', 'UK'),
+        (2, 'New Orleans Cajun Delights', 'Shelley Burke', 'USA'),
+        (3, 'Tokyo Traders', 'Yoshi Nagase', 'Japan'),
+        (4, 'Nord-Ost-Fisch', 'Sven Petersen', 'Germany'),
+        (5, 'Formaggi Fortini', 'Elio Rossi', 'Italy')
+    ],
+    # Products
+    'Products': [
+        (1, 'Chai', 1, 1, 18.0, 39),
+        (2, 'Chang', 1, 1, 19.0, 17),
+        (3, 'Aniseed Syrup', 2, 1, 10.0, 13),
+        (4, 'Chef Anton Cajun Seasoning', 2, 2, 22.0, 53),
+        (5, 'Gumbo Mix', 2, 2, 21.35, 0),
+        (6, 'Mozzarella di Giovanni', 3, 5, 34.8, 14),
+        (7, 'Gorgonzola Telino', 3, 5, 12.5, 0),
+        (8, 'Mascarpone Fabioli', 3, 5, 32.0, 9),
+        (9, 'Røgede sild', 5, 4, 9.65, 5),
+        (10, 'Spegesild', 5, 4, 12.0, 95)
+    ],
+    # Customers
+    'Customers': [
+        ('ALFKI', 'Alfreds Futterkiste', 'Maria Anders', 'Germany', 'Berlin'),
+        ('ANATR', 'Ana Trujillo Emparedados', 'Ana Trujillo', 'Mexico', 'México D.F.'),
+        ('BERGS', 'Berglunds snabbköp', 'Christina Berglund', 'Sweden', 'Luleå'),
+        ('BLAUS', 'Blauer See Delikatessen', 'Hanna Moos', 'Germany', 'Mannheim'),
+        ('BOLID', 'Bólido Comidas', 'Martín Sommer', 'Spain', 'Madrid')
+    ],
+    # Employees
+    'Employees': [
+        (1, 'Nancy', 'Davolio', 'Sales Representative', '1992-05-01', 'USA'),
+        (2, 'Andrew', 'Fuller', 'Vice President, Sales', '1992-08-14', 'USA'),
+        (3, 'Janet', 'Leverling', 'Sales Representative', '1992-04-01', 'USA'),
+        (4, 'Margaret', 'Peacock', 'Sales Representative', '1993-05-03', 'USA'),
+        (5, 'Steven', 'Buchanan', 'Sales Manager', '1993-10-17', 'UK')
+    ],
+    # Shippers
+    'Shippers': [
+        (1, 'Speedy Express', '(503) 555-9831'),
+        (2, 'United Package', '(503) 555-3199'),
+        (3, 'Federal Shipping', '(503) 555-9931')
+    ],
+    # Orders and OrderDetails, a few sample orders for brevity
+    'Orders': [
+        (10248, 'ALFKI', 5, '1996-07-04', 3, 'Germany'),
+        (10249, 'BERGS', 6, '1996-07-05', 1, 'Sweden'),
+        (10250, 'BLAUS', 4, '1996-07-08', 2, 'Germany')
+    ],
+    'OrderDetails': [
+        (10248, 1, 18.0, 12, 0.0),
+        (10248, 2, 19.0, 10, 0.0),
+        (10249, 3, 10.0, 5, 0.0),
+        (10250, 4, 22.0, 15, 0.15)
+    ]
+}
+
+def _sql_literal(value) -> str:
+    """Render a hardcoded sample value as a SQL literal"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    return repr(value)
+
+# One multi-row INSERT per table, built once at import
+SAMPLE_DATA_SQL = [
+    f"INSERT OR IGNORE INTO {table} VALUES "
+    + ", ".join("(" + ", ".join(_sql_literal(v) for v in row) + ")" for row in rows)
+    for table, rows in SAMPLE_DATA.items()
+]
+
+# Database setup and sample data creation
+class NorthwindDatabase:
+    # Stored in PRAGMA user_version once the schema and sample data are in place
+    SCHEMA_VERSION = 1
+    
+    def __init__(self, db_path: str = "northwind.db"):
+        self.db_path = db_path
+        self.setup_database()
+    
+    def setup_database(self):
+        """Create and populate the Northwind database with sample data"""
+        # Create tables
+        tables = {
+            'Categories': '''
+                CREATE TABLE IF NOT EXISTS Categories (
+                    CategoryID INTEGER PRIMARY KEY,
+                    CategoryName TEXT NOT NULL,
+                    Description TEXT
+                )
+            ''',
+            'Suppliers': '''
+                CREATE TABLE IF NOT EXISTS Suppliers (
+                    SupplierID INTEGER PRIMARY KEY,
+                    CompanyName TEXT NOT NULL,
+                    ContactName TEXT,
+                    Country TEXT
+                )
+            ''',
+            'Products': '''
+                CREATE TABLE IF NOT EXISTS Products (
+                    ProductID INTEGER PRIMARY KEY,
+                    ProductName TEXT NOT NULL,
+                    CategoryID INTEGER,
+                    SupplierID INTEGER,
+                    UnitPrice REAL,
+                    UnitsInStock INTEGER,
+                    FOREIGN KEY (CategoryID) REFERENCES Categories(CategoryID),
+                    FOREIGN KEY (SupplierID) REFERENCES Suppliers(SupplierID)
+                )
+            ''',
+            'Customers': '''
+                CREATE TABLE IF NOT EXISTS Customers (
+                    CustomerID TEXT PRIMARY KEY,
+                    CompanyName TEXT NOT NULL,
+                    ContactName TEXT,
+                    Country TEXT,
+                    City TEXT
+                )
+            ''',
+            'Employees': '''
+                CREATE TABLE IF NOT EXISTS Employees (
+                    EmployeeID INTEGER PRIMARY KEY,
+                    FirstName TEXT NOT NULL,
+                    LastName TEXT NOT NULL,
+                    Title TEXT,
+                    HireDate DATE,
+                    Country TEXT
+                )
+            ''',
+            'Shippers': '''
+                CREATE TABLE IF NOT EXISTS Shippers (
+                    ShipperID INTEGER PRIMARY KEY,
+                    CompanyName TEXT NOT NULL,
+                    Phone TEXT
+                )
+            ''',
+            'Orders': '''
+                CREATE TABLE IF NOT EXISTS Orders (
+                    OrderID INTEGER PRIMARY KEY,
+                    CustomerID TEXT,
+                    EmployeeID INTEGER,
+                    OrderDate DATE,
+                    ShipperID INTEGER,
+                    ShipCountry TEXT,
+                    FOREIGN KEY (CustomerID) REFERENCES Customers(CustomerID),
+                    FOREIGN KEY (EmployeeID) REFERENCES Employees(EmployeeID),
+                    FOREIGN KEY (ShipperID) REFERENCES Shippers(ShipperID)
+                )
+            ''',
+            'OrderDetails': '''
+                CREATE TABLE IF NOT EXISTS OrderDetails (
+                    OrderID INTEGER,
+                    ProductID INTEGER,
+                    UnitPrice REAL,
+                    Quantity INTEGER,
+                    Discount REAL,
+                    PRIMARY KEY (OrderID, ProductID),
+                    FOREIGN KEY (OrderID) REFERENCES Orders(OrderID),
+                    FOREIGN KEY (ProductID) REFERENCES Products(ProductID)
+                )
+            ''',
+            'Region': '''
+                CREATE TABLE IF NOT EXISTS Region (
+                    RegionID INTEGER PRIMARY KEY,
+                    RegionDescription TEXT NOT NULL
+                )
+            ''',
+            'Territories': '''
+                CREATE TABLE IF NOT EXISTS Territories (
+                    TerritoryID TEXT PRIMARY KEY,
+                    TerritoryDescription TEXT NOT NULL,
+                    RegionID INTEGER,
+                    FOREIGN KEY (RegionID) REFERENCES Region(RegionID)
+                )
+            ''',
+            'EmployeeTerritories': '''
+                CREATE TABLE IF NOT EXISTS EmployeeTerritories (
+                    EmployeeID INTEGER,
+                    TerritoryID TEXT,
+                    PRIMARY KEY (EmployeeID, TerritoryID),
+                    FOREIGN KEY (EmployeeID) REFERENCES Employees(EmployeeID),
+                    FOREIGN KEY (TerritoryID) REFERENCES Territories(TerritoryID)
+                )
+            '''
+        }
+        
+        indexes = [
+            'CREATE INDEX IF NOT EXISTS idx_od_productid ON OrderDetails(ProductID)',
+            'CREATE INDEX IF NOT EXISTS idx_p_categoryid ON Products(CategoryID)',
+            'CREATE INDEX IF NOT EXISTS idx_orders_customerid ON Orders(CustomerID)',
+            'CREATE INDEX IF NOT EXISTS idx_orders_employeeid ON Orders(EmployeeID)'
+        ]
+        
+        # Manage transactions explicitly so the bootstrap runs as one commit
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        cursor = conn.cursor()
+        try:
+            # Skip the bootstrap if a previous run already populated the database
+            if cursor.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+                return
+            
+            cursor.executescript(
+                "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+                "PRAGMA temp_store=MEMORY; PRAGMA cache_size=-65536;"
+            )
+            
+            cursor.execute("BEGIN IMMEDIATE")
+            # Check foreign keys once at COMMIT rather than after every insert
+            cursor.execute("PRAGMA defer_foreign_keys = ON")
+            
+            for table_name, create_sql in tables.items():
+                cursor.execute(create_sql)
+            
+            # Index the join keys used by the analytics queries
+            for index_sql in indexes:
+                cursor.execute(index_sql)
+            
+            # Insert sample data
+            self.insert_sample_data(cursor)
+            
+            # Refresh planner statistics so the indexes get picked up
+            cursor.execute("ANALYZE")
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+    
+    def insert_sample_data(self, cursor):
+        """Insert sample data into all tables"""
+        for insert_sql in SAMPLE_DATA_SQL:
+            cursor.execute(insert_sql)
@@ -0,0 +1,2 @@
+from plugins.database_plugin import DatabasePlugin
+from plugins.analytics_plugin import AnalyticsPlugin
@@ -0,0 +1,87 @@
+"""
+Analytics plugin with canned sales queries over the Northwind database
+"""
+
+import functools
+
+from plugins.sk_compat import kernel_function
+
+from plugins.sqlite_plugin import SQLitePlugin, rows_to_json
+
+# Analytics queries, kept constant so SQLite can reuse the prepared statements
+_SALES_BY_CATEGORY_SQL = """
+    SELECT 
+        c.CategoryName,
+        COUNT(od.OrderID) as TotalOrders,
+        SUM(od.Quantity) as TotalQuantity,
+        SUM(od.UnitPrice * od.Quantity * (1 - od.Discount)) as TotalRevenue,
+        AVG(od.UnitPrice * od.Quantity * (1 - od.Discount)) as AvgOrderValue
+    FROM OrderDetails od
+    JOIN Products p ON od.ProductID = p.ProductID
+    JOIN Categories c ON p.CategoryID = c.CategoryID
+    GROUP BY c.CategoryName
+    ORDER BY TotalRevenue DESC
+"""
+
+_TOP_PRODUCTS_SQL = """
+    WITH top AS (
+        SELECT 
+            ProductID,
+            SUM(Quantity) as TotalQuantitySold,
+            SUM(UnitPrice * Quantity * (1 - Discount)) as TotalRevenue
+        FROM OrderDetails
+        GROUP BY ProductID
+        ORDER BY TotalRevenue DESC
+        LIMIT ?
+    )
+    SELECT 
+        p.ProductName,
+        c.CategoryName,
+        t.TotalQuantitySold,
+        t.TotalRevenue
+    FROM top t
+    JOIN Products p ON p.ProductID = t.ProductID
+    JOIN Categories c ON c.CategoryID = p.CategoryID
+    ORDER BY t.TotalRevenue DESC
+"""
+
+# Analytics Plugin
+class AnalyticsPlugin(SQLitePlugin):
+    def __init__(self, db_path: str = "northwind.db"):
+        super().__init__(db_path)
+        self._sales_cache = functools.lru_cache(maxsize=1)(self._sales_by_category)
+        self._top_products_cache = functools.lru_cache(maxsize=32)(self._top_products)
+    
+    def _clear_caches(self):
+        self._sales_cache.cache_clear()
+        self._top_products_cache.cache_clear()
+    
+    def _sales_by_category(self) -> str:
+        return rows_to_json(self._conn().execute(_SALES_BY_CATEGORY_SQL))
+    
+    def _top_products(self, limit: int) -> str:
+        return rows_to_json(self._conn().execute(_TOP_PRODUCTS_SQL, (limit,)))
+    
+    @kernel_function(
+        description="Analyze sales performance by category",
+        name="analyze_sales_by_category"
+    )
+    def analyze_sales_by_category(self) -> str:
+        """Analyze sales performance by product category"""
+        try:
+            self._check_generation()
+            return self._sales_cache()
+        except Exception as e:
+            return f"Error analyzing sales: {str(e)}"
+    
+    @kernel_function(
+        description="Get top performing products",
+        name="get_top_products"
+    )
+    def get_top_products(self, limit: int = 10) -> str:
+        """Get top performing products by revenue"""
+        try:
+            self._check_generation()
+            return self._top_products_cache(limit)
+        except Exception as e:
+            return f"Error getting top products: {str(e)}"
@@ -0,0 +1,107 @@
+"""
+Database plugin exposing raw SQL access to the Northwind database
+"""
+
+import functools
+import re
+from typing import Dict, Optional
+
+from plugins.sk_compat import kernel_function
+
+from plugins.sqlite_plugin import SQLitePlugin, rows_to_json, to_json
+
+# Queries whose results may be served from the per-plugin result cache
+_READ_QUERY_RE = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+# Database Plugin for Semantic Kernel
+class DatabasePlugin(SQLitePlugin):
+    def __init__(self, db_path: str = "northwind.db", allow_writes: bool = False):
+        super().__init__(db_path, allow_writes)
+        # Cleared whenever the database is written, see SQLitePlugin._check_generation
+        self._tables_json: Optional[str] = None
+        self._schema_cache: Dict[str, str] = {}
+        self._qcache = functools.lru_cache(maxsize=256)(self._execute_uncached)
+    
+    def _clear_caches(self):
+        self._qcache.cache_clear()
+        self._tables_json = None
+        self._schema_cache.clear()
+    
+    def _execute_uncached(self, query: str) -> str:
+        return rows_to_json(self._conn().execute(query))
+    
+    @kernel_function(
+        description="Execute a SQL query against the Northwind database",
+        name="execute_query"
+    )
+    def execute_query(self, query: str) -> str:
+        """Execute SQL query and return results as JSON"""
+        try:
+            self._check_generation()
+            query = query.strip()
+            if _READ_QUERY_RE.match(query):
+                return self._qcache(query)
+            
+            # Anything else may modify data or schema, so invalidate every
+            # plugin's cached results once it has run
+            try:
+                return self._execute_uncached(query)
+            finally:
+                self._bump_generation()
+        except Exception as e:
+            return f"Error executing query: {str(e)}"
+    
+    @kernel_function(
+        description="Get table schema information",
+        name="get_table_schema"
+    )
+    def get_table_schema(self, table_name: str) -> str:
+        """Get schema information for a specific table"""
+        self._check_generation()
+        cached = self._schema_cache.get(table_name)
+        if cached is not None:
+            return cached
+        
+        try:
+            cursor = self._conn().execute(f"PRAGMA table_info({table_name})")
+            columns = cursor.fetchall()
+            if not columns:
+                # PRAGMA table_info returns nothing for unknown tables; don't cache that
+                return f"Error getting schema: no such table: {table_name}"
+            
+            schema_info = []
+            for col in columns:
+                schema_info.append({
+                    'column': col[1],
+                    'type': col[2],
+                    'nullable': not col[3],
+                    'default': col[4]
+                })
+            
+            result = to_json(schema_info)
+            self._schema_cache[table_name] = result
+            return result
+        except Exception as e:
+            return f"Error getting schema: {str(e)}"
+    
+    @kernel_function(
+        description="List all tables in the database",
+        name="list_tables"
+    )
+    def list_tables(self) -> str:
+        """List all tables in the database"""
+        self._check_generation()
+        if self._tables_json is not None:
+            return self._tables_json
+        
+        try:
+            cursor = self._conn().execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            )
+            tables = cursor.fetchall()
+            
+            table_list = [table[0] for table in tables]
+            self._tables_json = to_json(table_list)
+            return self._tables_json
+        except Exception as e:
+            return f"Error listing tables: {str(e)}"
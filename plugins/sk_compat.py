@@ -0,0 +1,12 @@
+"""
+Semantic Kernel decorator shim so the plugins import without the SDK
+"""
+
+try:
+    from semantic_kernel.functions import kernel_function
+except ImportError:  # optional: database-only use, e.g. the plugin tests
+    def kernel_function(func=None, **kwargs):
+        """Identity stand-in for semantic_kernel's kernel_function decorator"""
+        if func is None:
+            return lambda f: f
+        return func
@@ -0,0 +1,100 @@
+"""
+Shared SQLite connection handling and JSON encoding for the plugins
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+# Tool results are read by the model, so skip whitespace that only costs tokens
+JSON_SEPARATORS = (',', ':')
+
+def to_json(obj) -> str:
+    """Encode a tool result as compact JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=JSON_SEPARATORS)
+
+# Results longer than this are sent column-oriented instead of as records
+LARGE_RESULT_ROWS = 200
+
+def rows_to_json(cursor) -> str:
+    """Serialize the sqlite3.Row results of an executed cursor as JSON
+    
+    Small results are a list of records. Large ones use the split layout
+    {"columns": [...], "data": [[...], ...]} so column names appear once.
+    """
+    rows = cursor.fetchall()
+    if len(rows) > LARGE_RESULT_ROWS:
+        columns = [col[0] for col in cursor.description]
+        return to_json({'columns': columns, 'data': [tuple(row) for row in rows]})
+    return to_json([dict(row) for row in rows])
+
+# Shared connection handling for the SQLite-backed plugins
+class SQLitePlugin:
+    # Write generation per database file, shared by every plugin instance in
+    # the process so a write through one plugin invalidates the others' caches
+    _generations: Dict[str, int] = {}
+    _generations_lock = threading.Lock()
+    
+    def __init__(self, db_path: str = "northwind.db", allow_writes: bool = False):
+        self.db_path = db_path
+        # Connections are read-only unless writes are explicitly enabled, so
+        # model-issued DML/DDL cannot modify the database by default
+        self.allow_writes = allow_writes
+        self._local = threading.local()
+        self._cache_key = os.path.abspath(db_path)
+        self._cache_generation = self._generations.get(self._cache_key, 0)
+    
+    @classmethod
+    def write_generation(cls, db_path: str) -> int:
+        """Return how many plugin writes this process has made to a database"""
+        return cls._generations.get(os.path.abspath(db_path), 0)
+    
+    def _clear_caches(self):
+        """Drop cached results; overridden by plugins that keep any"""
+    
+    def _bump_generation(self):
+        """Record a write so all plugins on this database drop cached results"""
+        with self._generations_lock:
+            self._generations[self._cache_key] = self._generations.get(self._cache_key, 0) + 1
+    
+    def _check_generation(self):
+        """Clear this plugin's caches if the database was written since they were filled
+        
+        Writes through a plugin in this process bump the shared generation.
+        Commits from any other connection, including other processes, change
+        PRAGMA data_version on this thread's connection.
+        """
+        generation = self._generations.get(self._cache_key, 0)
+        data_version = self._conn().execute("PRAGMA data_version").fetchone()[0]
+        # A thread's first check has nothing to compare against, so start clean
+        seen_version = getattr(self._local, "data_version", None)
+        self._local.data_version = data_version
+        if generation != self._cache_generation or seen_version != data_version:
+            self._clear_caches()
+            self._cache_generation = generation
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=256
+            )
+            conn.executescript("PRAGMA journal_mode=WAL; PRAGMA cache_size=-65536;")
+            if not self.allow_writes:
+                conn.execute("PRAGMA query_only = ON")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
@@ -1,9 +1,10 @@
 # test_agent.py
 import pytest
 import asyncio
-from main import NorthwindAIAgent, NorthwindDatabase
+from db import NorthwindDatabase
 from plugins.database_plugin import DatabasePlugin
 from plugins.analytics_plugin import AnalyticsPlugin
+from plugins.sqlite_plugin import LARGE_RESULT_ROWS
 
 class TestNorthwindAIAgent:
     """Test suite for the AI agent system"""
@@ -13,16 +14,22 @@ class TestNorthwindAIAgent:
         """Setup test database"""
         db = NorthwindDatabase("test_northwind.db")
         yield db
-        # Cleanup
+        # Cleanup, including the WAL sidecar files
         import os
-        if os.path.exists("test_northwind.db"):
-            os.remove("test_northwind.db")
+        for path in ("test_northwind.db", "test_northwind.db-wal", "test_northwind.db-shm"):
+            if os.path.exists(path):
+                os.remove(path)
     
     @pytest.fixture
     def database_plugin(self, setup_database):
         """Create database plugin for testing"""
         return DatabasePlugin("test_northwind.db")
     
+    @pytest.fixture
+    def writable_database_plugin(self, setup_database):
+        """Create database plugin that may modify the test database"""
+        return DatabasePlugin("test_northwind.db", allow_writes=True)
+    
     @pytest.fixture
     def analytics_plugin(self, setup_database):
         """Create analytics plugin for testing"""
@@ -48,6 +55,45 @@ class TestNorthwindAIAgent:
         for table in required_tables:
             assert table in table_list
     
+    def test_setup_skipped_when_populated(self, tmp_path):
+        """Test that a second construction skips the bootstrap"""
+        import sqlite3
+        db_path = str(tmp_path / "northwind.db")
+        NorthwindDatabase(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM Categories WHERE CategoryID = 5")
+        conn.commit()
+        
+        # A re-run bootstrap would restore the deleted row via INSERT OR IGNORE
+        NorthwindDatabase(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM Categories").fetchone()[0] == 4
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        conn.close()
+    
+    def test_setup_upgrades_unversioned_database(self, tmp_path):
+        """Test that a database from before user_version tracking is bootstrapped once"""
+        import sqlite3
+        db_path = str(tmp_path / "northwind.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE Categories (CategoryID INTEGER PRIMARY KEY, "
+            "CategoryName TEXT NOT NULL, Description TEXT)"
+        )
+        conn.execute("INSERT INTO Categories VALUES (1, 'Beverages', 'Drinks')")
+        conn.commit()
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+        
+        NorthwindDatabase(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM Categories").fetchone()[0] == 5
+        assert conn.execute("SELECT COUNT(*) FROM OrderDetails").fetchone()[0] == 4
+        # Existing rows are kept rather than overwritten
+        assert conn.execute(
+            "SELECT Description FROM Categories WHERE CategoryID = 1"
+        ).fetchone()[0] == 'Drinks'
+        conn.close()
+    
     def test_query_execution(self, database_plugin):
         """Test SQL query execution"""
         result = database_plugin.execute_query("SELECT COUNT(*) as count FROM Categories")
@@ -58,6 +104,26 @@ class TestNorthwindAIAgent:
         assert len(data) > 0
         assert 'count' in data[0]
     
+    def test_large_result_layout(self, database_plugin):
+        """Test that results over LARGE_RESULT_ROWS use the columns/data layout"""
+        import json
+        # 10 products x 5 categories x 5 suppliers = 250 rows
+        cross_join = (
+            "SELECT p.ProductID, c.CategoryID, s.SupplierID "
+            "FROM Products p CROSS JOIN Categories c CROSS JOIN Suppliers s"
+        )
+        
+        data = json.loads(database_plugin.execute_query(f"{cross_join} LIMIT {LARGE_RESULT_ROWS + 1}"))
+        assert data['columns'] == ['ProductID', 'CategoryID', 'SupplierID']
+        assert len(data['data']) == LARGE_RESULT_ROWS + 1
+        assert all(len(row) == 3 for row in data['data'])
+        
+        # A result exactly at the threshold stays a list of records
+        records = json.loads(database_plugin.execute_query(f"{cross_join} LIMIT {LARGE_RESULT_ROWS}"))
+        assert isinstance(records, list)
+        assert len(records) == LARGE_RESULT_ROWS
+        assert set(records[0]) == {'ProductID', 'CategoryID', 'SupplierID'}
+    
     def test_schema_retrieval(self, database_plugin):
         """Test table schema retrieval"""
         schema = database_plugin.get_table_schema("Products")
@@ -84,6 +150,70 @@ class TestNorthwindAIAgent:
         top_products = analytics_plugin.get_top_products(5)
         assert "Error" not in top_products
     
+    def test_query_result_cache(self, database_plugin):
+        """Test that repeated SELECTs are served from the cache"""
+        query = "SELECT COUNT(*) as count FROM Products"
+        first = database_plugin.execute_query(query)
+        assert database_plugin.execute_query(query) == first
+        assert database_plugin._qcache.cache_info().hits == 1
+    
+    def test_cache_invalidated_by_write(self, writable_database_plugin, analytics_plugin):
+        """Test that a write through one plugin refreshes every plugin's cached results"""
+        import json
+        count_query = "SELECT COUNT(*) as count FROM OrderDetails"
+        assert json.loads(writable_database_plugin.execute_query(count_query))[0]['count'] == 4
+        top_before = json.loads(analytics_plugin.get_top_products(5))
+        assert top_before[0]['ProductName'] == 'Chef Anton Cajun Seasoning'
+        sales_before = analytics_plugin.analyze_sales_by_category()
+        
+        writable_database_plugin.execute_query("INSERT INTO OrderDetails VALUES (10249, 10, 12.0, 100, 0.0)")
+        
+        assert json.loads(writable_database_plugin.execute_query(count_query))[0]['count'] == 5
+        assert json.loads(analytics_plugin.get_top_products(5))[0]['ProductName'] == 'Spegesild'
+        assert analytics_plugin.analyze_sales_by_category() != sales_before
+    
+    def test_cache_invalidated_by_external_write(self, database_plugin, analytics_plugin):
+        """Test that commits from another connection refresh cached results"""
+        import json
+        import sqlite3
+        count_query = "SELECT COUNT(*) as count FROM OrderDetails"
+        assert json.loads(database_plugin.execute_query(count_query))[0]['count'] == 4
+        top_before = json.loads(analytics_plugin.get_top_products(3))
+        assert top_before[0]['ProductName'] == 'Chef Anton Cajun Seasoning'
+        
+        conn = sqlite3.connect("test_northwind.db")
+        conn.execute("INSERT INTO OrderDetails VALUES (10249, 10, 12.0, 100, 0.0)")
+        conn.commit()
+        conn.close()
+        
+        assert json.loads(database_plugin.execute_query(count_query))[0]['count'] == 5
+        assert json.loads(analytics_plugin.get_top_products(3))[0]['ProductName'] == 'Spegesild'
+    
+    def test_table_cache_invalidated_by_ddl(self, writable_database_plugin):
+        """Test that DDL refreshes the cached table list"""
+        import json
+        assert 'Foo' not in json.loads(writable_database_plugin.list_tables())
+        writable_database_plugin.execute_query("CREATE TABLE Foo (x INTEGER)")
+        assert 'Foo' in json.loads(writable_database_plugin.list_tables())
+    
+    def test_writes_rejected_by_default(self, database_plugin):
+        """Test that the default plugin cannot modify the database"""
+        import json
+        result = database_plugin.execute_query("DELETE FROM Categories")
+        assert "Error" in result
+        
+        count = database_plugin.execute_query("SELECT COUNT(*) as count FROM Categories")
+        assert json.loads(count)[0]['count'] == 5
+    
+    def test_writes_persist_when_enabled(self, writable_database_plugin):
+        """Test that an opted-in write is committed immediately"""
+        import sqlite3
+        writable_database_plugin.execute_query("DELETE FROM Shippers WHERE ShipperID = 3")
+        
+        conn = sqlite3.connect("test_northwind.db")
+        assert conn.execute("SELECT COUNT(*) FROM Shippers").fetchone()[0] == 2
+        conn.close()
+    
     def test_error_handling(self, database_plugin):
         """Test error handling for invalid queries"""
         # Invalid SQL should return error message
@@ -93,6 +223,15 @@ class TestNorthwindAIAgent:
         # Invalid table name should return error
         schema = database_plugin.get_table_schema("NonExistentTable")
         assert "Error" in schema
+    
+    def test_schema_of_later_created_table(self, writable_database_plugin):
+        """Test that a missing table's schema is not cached"""
+        assert "Error" in writable_database_plugin.get_table_schema("LateTable")
+        writable_database_plugin.execute_query("CREATE TABLE LateTable (LateID INTEGER)")
+        
+        import json
+        schema_data = json.loads(writable_database_plugin.get_table_schema("LateTable"))
+        assert [col['column'] for col in schema_data] == ['LateID']
 
 # Run tests
 if __name__ == "__main__":
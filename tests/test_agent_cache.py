@@ -0,0 +1,117 @@
+# test_agent_cache.py
+import asyncio
+import pytest
+import agent as agent_module
+from agent import NorthwindAIAgent
+from config import get_config
+from plugins.database_plugin import DatabasePlugin
+
+class FakeKernel:
+    """Stand-in for the kernel that replays canned model responses"""
+    
+    def __init__(self, *responses, on_invoke=None):
+        self.responses = list(responses)
+        self.on_invoke = on_invoke
+        self.calls = 0
+    
+    async def invoke_prompt(self, **kwargs):
+        self.calls += 1
+        if self.on_invoke is not None:
+            self.on_invoke()
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+class TestAgentResponseCache:
+    """Test suite for the on-disk LLM response cache"""
+    
+    @pytest.fixture(autouse=True)
+    def llm_cache(self, tmp_path, monkeypatch):
+        """Point the response cache at a fresh directory"""
+        monkeypatch.setenv("_DOTENV_LOADED", "1")
+        monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache"))
+        get_config.cache_clear()
+        agent_module._get_cache.cache_clear()
+        yield
+        agent_module._get_cache().close()
+        agent_module._get_cache.cache_clear()
+        get_config.cache_clear()
+    
+    @pytest.fixture
+    def make_agent(self, tmp_path):
+        """Build agents on a per-test database with a fake kernel"""
+        agents = []
+        
+        def factory(kernel, db_name="northwind.db"):
+            agent = NorthwindAIAgent("test-key", str(tmp_path / db_name))
+            agent.kernel = kernel
+            agents.append(agent)
+            return agent
+        
+        yield factory
+        for agent in agents:
+            asyncio.run(agent.aclose())
+    
+    def test_cache_hit_skips_model(self, make_agent):
+        """Test that a repeated question is answered from the cache"""
+        kernel = FakeKernel("answer")
+        agent = make_agent(kernel)
+        
+        assert asyncio.run(agent.process_query("How many products?")) == "answer"
+        assert asyncio.run(agent.process_query("How many products?")) == "answer"
+        assert kernel.calls == 1
+    
+    def test_errors_not_cached(self, make_agent):
+        """Test that a failed model call is retried next time"""
+        kernel = FakeKernel(RuntimeError("boom"), "answer")
+        agent = make_agent(kernel)
+        
+        assert asyncio.run(agent.process_query("How many products?")) == "Error processing query: boom"
+        assert asyncio.run(agent.process_query("How many products?")) == "answer"
+        assert kernel.calls == 2
+    
+    def test_cancelled_response_not_cached(self, make_agent):
+        """Test that a None response from a cancelled call is not stored"""
+        kernel = FakeKernel(None, "answer")
+        agent = make_agent(kernel)
+        
+        asyncio.run(agent.process_query("How many products?"))
+        assert asyncio.run(agent.process_query("How many products?")) == "answer"
+        assert kernel.calls == 2
+    
+    def test_cache_keyed_by_database(self, make_agent):
+        """Test that agents on different databases don't share answers"""
+        kernel_a = FakeKernel("answer a")
+        kernel_b = FakeKernel("answer b")
+        agent_a = make_agent(kernel_a, "a.db")
+        agent_b = make_agent(kernel_b, "b.db")
+        
+        assert asyncio.run(agent_a.process_query("How many products?")) == "answer a"
+        assert asyncio.run(agent_b.process_query("How many products?")) == "answer b"
+        assert kernel_a.calls == 1
+        assert kernel_b.calls == 1
+    
+    def test_answers_that_write_not_cached(self, make_agent, tmp_path):
+        """Test that an answer whose tool calls wrote to the database is not replayed"""
+        writer = DatabasePlugin(str(tmp_path / "northwind.db"), allow_writes=True)
+        kernel = FakeKernel(
+            "deleted", "deleted again",
+            on_invoke=lambda: writer.execute_query("DELETE FROM Shippers WHERE ShipperID = 3")
+        )
+        agent = make_agent(kernel)
+        
+        assert asyncio.run(agent.process_query("Delete shipper 3")) == "deleted"
+        assert asyncio.run(agent.process_query("Delete shipper 3")) == "deleted again"
+        assert kernel.calls == 2
+    
+    def test_write_invalidates_cached_answers(self, make_agent, tmp_path):
+        """Test that a write made after an answer was cached forces a fresh answer"""
+        kernel = FakeKernel("3 shippers", "2 shippers")
+        agent = make_agent(kernel)
+        
+        assert asyncio.run(agent.process_query("How many shippers?")) == "3 shippers"
+        writer = DatabasePlugin(str(tmp_path / "northwind.db"), allow_writes=True)
+        writer.execute_query("DELETE FROM Shippers WHERE ShipperID = 3")
+        assert asyncio.run(agent.process_query("How many shippers?")) == "2 shippers"
+        assert kernel.calls == 2
@@ -0,0 +1,31 @@
+# test_config.py
+import pytest
+from config import get_config
+
+class TestConfig:
+    """Test suite for environment-driven configuration"""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_config(self, monkeypatch):
+        """Rebuild the cached config for each test"""
+        # Keep a local .env from overriding the values under test
+        monkeypatch.setenv("_DOTENV_LOADED", "1")
+        get_config.cache_clear()
+        yield
+        get_config.cache_clear()
+    
+    def test_numeric_settings(self, monkeypatch):
+        """Test that numeric settings are parsed from the environment"""
+        monkeypatch.setenv("MAX_TOKENS", "512")
+        monkeypatch.setenv("TEMPERATURE", "0.2")
+        config = get_config()
+        assert config.max_tokens == 512
+        assert config.temperature == 0.2
+    
+    def test_malformed_numeric_settings_fall_back(self, monkeypatch):
+        """Test that malformed numeric settings use the defaults"""
+        monkeypatch.setenv("MAX_TOKENS", "abc")
+        monkeypatch.setenv("TEMPERATURE", "warm")
+        config = get_config()
+        assert config.max_tokens == 2000
+        assert config.temperature == 0.7
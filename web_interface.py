@@ -1,23 +1,24 @@
 # web_interface.py (Optional Flask Web Interface)
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, request, jsonify
 import asyncio
-from main import NorthwindAIAgent
-from config import config
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from agent import NorthwindAIAgent
+from config import get_config
 
 app = Flask(__name__)
 
-# Initialize AI agent
+# AI agent and its event loop, created on first use by _get_agent() and
+# _get_loop() so each worker process starts its own after any fork
 agent = None
+loop = None
+_agent_lock = threading.Lock()
 
-@app.before_first_request
-def initialize_agent():
-    global agent
-    agent = NorthwindAIAgent(config.openai_api_key)
+# Seconds a /query request waits for the agent before giving up
+QUERY_TIMEOUT = 120
 
-@app.route('/')
-def home():
-    """Main interface"""
-    return render_template_string("""
+# The home page has no server-side variables, so serve it as a static string
+_HOME_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -70,7 +71,36 @@ def home():
         </script>
     </body>
     </html>
-    """)
+    """
+
+def _get_agent() -> NorthwindAIAgent:
+    """Return the shared agent, constructing it exactly once"""
+    global agent
+    if agent is None:
+        with _agent_lock:
+            if agent is None:
+                agent = NorthwindAIAgent(get_config().openai_api_key)
+    return agent
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it exactly once
+    
+    One long-lived loop serves all requests, so the agent's HTTP client can
+    keep its connections alive between queries.
+    """
+    global loop
+    if loop is None:
+        with _agent_lock:
+            if loop is None:
+                new_loop = asyncio.new_event_loop()
+                threading.Thread(target=new_loop.run_forever, daemon=True).start()
+                loop = new_loop
+    return loop
+
+@app.route('/')
+def home():
+    """Main interface"""
+    return Response(_HOME_HTML, mimetype='text/html')
 
 @app.route('/query', methods=['POST'])
 def query():
@@ -82,13 +112,16 @@ def query():
         return jsonify({'error': 'Query is required'}), 400
     
     try:
-        # Run async function in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        response = loop.run_until_complete(agent.process_query(user_query))
-        loop.close()
+        # Run async function on the shared background loop
+        fut = asyncio.run_coroutine_threadsafe(
+            _get_agent().process_query(user_query), _get_loop()
+        )
+        response = fut.result(timeout=QUERY_TIMEOUT)
         
         return jsonify({'response': response})
+    except FutureTimeoutError:
+        fut.cancel()
+        return jsonify({'error': 'Query timed out'}), 504
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 